@@ -42,42 +42,55 @@ log_config = {
     },
 }
 
-# Register the appropriate modules
-# need to call epi before tb to get bcg vax
-# seed = random.randint(0, 50000)
-seed = 32  # set seed for reproducibility
-
-sim = Simulation(start_date=start_date, seed=seed, log_config=log_config, show_progress_bar=True)
-sim.register(*fullmodel(
-    resourcefilepath=resourcefilepath,
-    use_simplified_births=False,
-    module_kwargs={
-        "SymptomManager": {"spurious_symptoms": True},
-        "HealthSystem": {"disable": False,
-                         "service_availability": ["*"],
-                         "mode_appt_constraints": 1,
-                         "cons_availability": "default",
-                         "beds_availability": "all",
-                         "ignore_priority": False,
-                         "use_funded_or_actual_staffing": "actual"},
-    },
-))
 
-# # set the scenario
-# sim.modules["Tb"].parameters["scenario"] = scenario
-# sim.modules["Tb"].parameters["scenario_start_date"] = Date(2023, 1, 1)
+def run_simulation():
+    """Run the simulation and return the path to the log file written."""
+    # Register the appropriate modules
+    # need to call epi before tb to get bcg vax
+    # seed = random.randint(0, 50000)
+    seed = 32  # set seed for reproducibility
+
+    sim = Simulation(start_date=start_date, seed=seed, log_config=log_config, show_progress_bar=True)
+    sim.register(*fullmodel(
+        resourcefilepath=resourcefilepath,
+        use_simplified_births=False,
+        module_kwargs={
+            "SymptomManager": {"spurious_symptoms": True},
+            "HealthSystem": {"disable": False,
+                             "service_availability": ["*"],
+                             "mode_appt_constraints": 1,
+                             "cons_availability": "default",
+                             "beds_availability": "all",
+                             "ignore_priority": False,
+                             "use_funded_or_actual_staffing": "actual"},
+        },
+    ))
+
+    # # set the scenario
+    # sim.modules["Tb"].parameters["scenario"] = scenario
+    # sim.modules["Tb"].parameters["scenario_start_date"] = Date(2023, 1, 1)
+
+    # Run the simulation and flush the logger
+    sim.make_initial_population(n=popsize)
+    sim.simulate(end_date=end_date)
+    return sim.log_filepath
+
+
+def analyze(log_filepath):
+    """Parse the log file and save the results for plotting."""
+    # parse the results
+    output = parse_log_file(log_filepath)
+
+    # save the results, argument 'wb' means write using binary mode. use 'rb' for reading file
+    with open(outputpath / "default_run.pickle", "wb") as f:
+        # Pickle the 'data' dictionary using the highest protocol available.
+        pickle.dump(dict(output), f, pickle.HIGHEST_PROTOCOL)
+    return output
 
-# Run the simulation and flush the logger
-sim.make_initial_population(n=popsize)
-sim.simulate(end_date=end_date)
 
-# parse the results
-output = parse_log_file(sim.log_filepath)
+def main():
+    analyze(run_simulation())
 
-# save the results, argument 'wb' means write using binary mode. use 'rb' for reading file
-with open(outputpath / "default_run.pickle", "wb") as f:
-    # Pickle the 'data' dictionary using the highest protocol available.
-    pickle.dump(dict(output), f, pickle.HIGHEST_PROTOCOL)
 
-with open(outputpath / "default_run.pickle", "rb") as f:
-    output = pickle.load(f)
+if __name__ == "__main__":
+    main()
@@ -3,6 +3,7 @@ General utility functions for TLO analysis
 """
 import fileinput
 import gzip
+import hashlib
 import json
 import os
 import pickle
@@ -45,12 +46,69 @@ def _parse_log_file_inner_loop(filepath, level):
     return output_logs
 
 
-def parse_log_file(log_filepath, level: int = logging.INFO):
+def _get_file_state(filepath) -> Tuple[int, int]:
+    """Returns the modification time (in nanoseconds) and size of a file, used to detect whether it has changed."""
+    file_stat = os.stat(filepath)
+    return file_stat.st_mtime_ns, file_stat.st_size
+
+
+def _get_cache_path(filepath, *key) -> Path:
+    """Returns path of file in which to cache results derived from the file at `filepath`.
+
+    The name of the cache file is a hash of the absolute path of the file plus any further values in `key`, so that
+    each cached result overwrites any previous result cached for the same file and key.
+    """
+    filepath = Path(filepath).resolve()
+    cache_key = repr((str(filepath), *key))
+    return filepath.parent / '.cache' / f'{hashlib.sha1(cache_key.encode()).hexdigest()}.pickle'
+
+
+def _load_from_cache(cache_path: Path, file_state: Tuple[int, int]):
+    """Returns the object pickled in the cache file, or `None` if there is no (readable) cache file or the object was
+    cached for a different state (modification time and size) of the file it was derived from."""
+    try:
+        with open(cache_path, 'rb') as f:
+            cached_file_state, obj = pickle.load(f)
+    except Exception:
+        # Unpickling can fail in many ways (for example a cache file written with different package versions
+        # referencing classes which no longer exist) - in all cases treat as if there was no cached result
+        return None
+    return obj if cached_file_state == file_state else None
+
+
+def _save_to_cache(cache_path: Path, file_state: Tuple[int, int], obj) -> None:
+    """Pickles the object, with the state of the file it was derived from, to the cache file, replacing any previous
+    cached object. Caching is skipped if the cache file cannot be written."""
+    try:
+        cache_path.parent.mkdir(exist_ok=True)
+        with open(cache_path, 'wb') as f:
+            pickle.dump((file_state, obj), f, pickle.HIGHEST_PROTOCOL)
+    except OSError:
+        pass
+
+
+def _parse_log_file_inner_loop_with_cache(filepath, level):
+    """Parses the log file and returns dictionary of dataframes, reusing the result of any previous parse of the
+    unchanged log file at the same level"""
+    cache_path = _get_cache_path(filepath, level)
+    file_state = _get_file_state(filepath)
+    output_logs = _load_from_cache(cache_path, file_state)
+    if output_logs is None:
+        output_logs = _parse_log_file_inner_loop(filepath, level)
+        _save_to_cache(cache_path, file_state, output_logs)
+    return output_logs
+
+
+def parse_log_file(log_filepath, level: int = logging.INFO, cache: bool = False):
     """Parses logged output from a TLO run, split it into smaller logfiles and returns a class containing paths to
     these split logfiles.
 
     :param log_filepath: file path to log file
     :param level: parse everything from the given level
+    :param cache: whether to cache the split logfiles and parsed logs in a `.cache` directory alongside the log file,
+        and reuse any results previously cached there for the unchanged log file instead of parsing it again. If set,
+        pickle files are written to the `.cache` directory, with one file for the split logfiles plus one for each
+        module-specific logfile parsed; these files are overwritten when the log file is parsed again after changing.
     :return: a class containing paths to split logfiles
     """
     print(f'Processing log file {log_filepath}')
@@ -58,6 +116,18 @@ def parse_log_file(log_filepath, level: int = logging.INFO):
     module_name_to_filehandle: Dict[str, TextIO] = dict()  # module name to file handle
 
     log_directory = Path(log_filepath).parent
+
+    if cache:
+        # reuse split logfiles from a previous call if the log file and the split logfiles are all unchanged
+        split_cache_path = _get_cache_path(log_filepath)
+        log_file_state = _get_file_state(log_filepath)
+        split_logfiles = _load_from_cache(split_cache_path, log_file_state)
+        if split_logfiles is not None and all(
+            os.path.exists(path) and _get_file_state(path) == state for path, state in split_logfiles.values()
+        ):
+            print(f'Using previously written module-specific log files in {log_directory}')
+            return LogsDict({name: path for name, (path, _) in split_logfiles.items()}, level, cache=cache)
+
     print(f'Writing module-specific log files to {log_directory}')
 
     # iterate over each line in the logfile
@@ -83,8 +153,18 @@ def parse_log_file(log_filepath, level: int = logging.INFO):
     for file_handle in module_name_to_filehandle.values():
         file_handle.close()
 
+    if cache:
+        _save_to_cache(
+            split_cache_path,
+            log_file_state,
+            {
+                name: (os.path.abspath(handle.name), _get_file_state(handle.name))
+                for name, handle in module_name_to_filehandle.items()
+            }
+        )
+
     # return an object that accepts as an argument a dictionary containing paths to split logfiles
-    return LogsDict({name: handle.name for name, handle in module_name_to_filehandle.items()}, level)
+    return LogsDict({name: handle.name for name, handle in module_name_to_filehandle.items()}, level, cache=cache)
 
 
 def merge_log_files(log_path_1: Path, log_path_2: Path, output_path: Path) -> None:
@@ -530,10 +610,11 @@ def compare_number_of_deaths(logfile: Path, resourcefilepath: Path):
         sf = 1.0
 
     # - extract number of death by period/sex/age-group
+    # (groups do not need sorting here as the result is re-grouped by period below)
     model = output['tlo.methods.demography']['death'].assign(
-        year=lambda x: x['date'].dt.year
+        year=lambda x: util.get_year(x['date'])
     ).groupby(
-        ['sex', 'year', 'age', 'label']
+        ['sex', 'year', 'age', 'label'], sort=False
     )['person_id'].count().mul(sf)
 
     # - format categories:
@@ -640,7 +721,7 @@ class LogsDict(Mapping):
             }
     """
 
-    def __init__(self, file_names_and_paths, level):
+    def __init__(self, file_names_and_paths, level, cache=False):
         super().__init__()
         # initialise class with module-specific log files paths
         self._logfile_names_and_paths: Dict[str, str] = file_names_and_paths
@@ -650,13 +731,21 @@ class LogsDict(Mapping):
 
         self._level = level
 
+        # whether to cache parsed logs on disk alongside module-specific log files
+        self._cache_on_disk = cache
+
     def __getitem__(self, key, cache=True):
         # check if the requested key is found in a dictionary containing module name and log file paths. if key
         # is found, return parsed logs else return KeyError
         if key in self._logfile_names_and_paths:
             # check if key is found in cache
             if key not in self._results_cache:
-                result_df = _parse_log_file_inner_loop(self._logfile_names_and_paths[key], self._level)
+                if self._cache_on_disk:
+                    result_df = _parse_log_file_inner_loop_with_cache(
+                        self._logfile_names_and_paths[key], self._level
+                    )
+                else:
+                    result_df = _parse_log_file_inner_loop(self._logfile_names_and_paths[key], self._level)
                 # get metadata for the selected log file and merge it all with the selected key
                 result_df[key]['_metadata'] = result_df['_metadata']
                 if not cache:  # check if caching is disallowed
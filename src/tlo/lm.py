@@ -2,8 +2,7 @@ import ast
 import builtins
 import numbers
 from enum import Enum, auto
-from math import prod
-from typing import Any, Callable, Dict, Optional, Tuple, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 import numpy as np
 import pandas as pd
@@ -14,6 +13,396 @@ from tlo import logging
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
+# Maximum number of entries in table used to evaluate interval conditions on
+# integer columns by lookup
+_MAX_INTERVAL_LOOKUP_TABLE_SIZE = 10_000
+
+# Map from comparison operators in condition strings to equivalent NumPy ufuncs
+_COMPARISON_UFUNCS = {
+    ast.Eq: np.equal,
+    ast.NotEq: np.not_equal,
+    ast.Lt: np.less,
+    ast.LtE: np.less_equal,
+    ast.Gt: np.greater,
+    ast.GtE: np.greater_equal,
+}
+
+# Map from bitwise operators in condition strings to equivalent logical NumPy ufuncs
+# for boolean arrays
+_LOGICAL_UFUNCS = {
+    ast.BitAnd: np.logical_and,
+    ast.BitOr: np.logical_or,
+}
+
+
+class _ColumnResolvers(dict):
+    """Mapping from names used in predictor conditions to column ``Series``.
+
+    Additionally caches the NumPy array of values of each column accessed via the
+    ``array`` method, so that the values of a column referenced in several
+    conditions or predictors are only extracted once per ``LinearModel.predict`` call.
+    Arrays returned by ``array`` are shared and so must not be modified in place.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._arrays = {}
+
+    def array(self, name: str) -> np.ndarray:
+        """Get the NumPy array of values of the column with the given name."""
+        try:
+            return self._arrays[name]
+        except KeyError:
+            array = self._arrays[name] = self[name].to_numpy()
+            return array
+
+
+def _structure_condition(condition: Optional[str]) -> Tuple:
+    """Convert a condition string to a ``(kind, column, op, operand)`` tuple.
+
+    Simple conditions on a single column - comparisons against a literal value and
+    calls to the ``between``, ``isin`` and ``isna`` methods with literal arguments -
+    are converted to a structured form which can be evaluated directly on NumPy
+    arrays. Any other condition is kept as an ``'expr'`` kind to be evaluated with
+    ``pandas.eval``. An unconditioned (``otherwise``) value is given kind ``'else'``
+    and a condition which is a boolean literal is given kind ``'const'``.
+    """
+    if condition is None:
+        return ("else", None, None, None)
+    try:
+        node = ast.parse(condition.strip(), mode="eval").body
+    except SyntaxError:
+        structured_condition = None
+    else:
+        if isinstance(node, ast.Constant) and isinstance(node.value, bool):
+            return ("const", None, None, node.value)
+        structured_condition = _structure_node(node)
+    if structured_condition is None:
+        return ("expr", None, None, condition)
+    return structured_condition
+
+
+def _check_structured_condition(structured_condition: Tuple) -> None:
+    """Check a ``(kind, column, op, operand)`` tuple is valid for its kind of condition.
+
+    Raises an ``AssertionError`` if the tuple is not valid, so that the functions
+    evaluating structured conditions can rely on their operands being of the types
+    expected for each kind of condition.
+    """
+    assert len(structured_condition) == 4, "Structured condition must have 4 items"
+    kind, column, op, operand = structured_condition
+    literal_types = (str, numbers.Number)
+    if kind == "compare":
+        assert isinstance(column, str) and op in _COMPARISON_UFUNCS.values()
+        assert isinstance(operand, literal_types), f"Invalid operand {operand!r}"
+    elif kind == "range":
+        assert isinstance(column, str)
+        assert (
+            isinstance(operand, tuple)
+            and len(operand) == 2
+            and all(isinstance(bound, literal_types) for bound in operand)
+        ), f"Invalid range bounds {operand!r}"
+    elif kind == "isin":
+        assert isinstance(column, str)
+        assert isinstance(operand, tuple), f"Invalid isin values {operand!r}"
+    elif kind == "isna":
+        assert isinstance(column, str) and operand is None
+    elif kind == "expr":
+        assert isinstance(operand, str), f"Invalid expression {operand!r}"
+    elif kind == "const":
+        assert isinstance(operand, bool), f"Invalid constant condition {operand!r}"
+    else:
+        assert kind == "else", f"Unknown condition kind {kind!r}"
+
+
+def _structure_node(node: ast.AST) -> Optional[Tuple]:
+    """Convert a parsed simple condition to a ``(kind, column, op, operand)`` tuple.
+
+    Returns ``None`` if the condition is not a simple condition on a single column.
+    """
+    try:
+        if (
+            isinstance(node, ast.Compare)
+            and isinstance(node.left, ast.Name)
+            and len(node.ops) == 1
+            and type(node.ops[0]) in _COMPARISON_UFUNCS
+        ):
+            operand = ast.literal_eval(node.comparators[0])
+            if isinstance(operand, (str, numbers.Number)):
+                return (
+                    "compare",
+                    node.left.id,
+                    _COMPARISON_UFUNCS[type(node.ops[0])],
+                    operand,
+                )
+        elif (
+            isinstance(node, ast.Call)
+            and isinstance(node.func, ast.Attribute)
+            and isinstance(node.func.value, ast.Name)
+            and len(node.keywords) == 0
+        ):
+            column, method = node.func.value.id, node.func.attr
+            args = tuple(ast.literal_eval(arg) for arg in node.args)
+            if (
+                method == "between"
+                and len(args) == 2
+                and all(isinstance(arg, (str, numbers.Number)) for arg in args)
+            ):
+                return ("range", column, None, args)
+            elif (
+                method == "isin"
+                and len(args) == 1
+                and isinstance(args[0], (list, tuple, set))
+            ):
+                # Other iterables (such as strings) are left to pandas to reject
+                return ("isin", column, None, tuple(args[0]))
+            elif method in ("isna", "isnull") and len(args) == 0:
+                return ("isna", column, None, None)
+    except (ValueError, TypeError):
+        # Non-literal arguments
+        pass
+    return None
+
+
+class _UnsupportedColumnType(Exception):
+    """Raised when a column cannot be used in evaluating an expression on arrays."""
+
+
+def _compile_array_expression(
+    node: ast.AST,
+) -> Optional[Callable[[Dict[str, pd.Series]], np.ndarray]]:
+    """Create a function evaluating a compound condition directly on NumPy arrays.
+
+    Supports conditions combining simple conditions on single columns (as converted
+    by ``_structure_node``) and the values of boolean columns with the logical
+    operators ``&``, ``|`` and ``~``. As comparisons are only supported as simple
+    conditions with a column name on the left and a literal value on the right, the
+    operators in supported conditions must be grouped (by parentheses) in the same
+    way under both Python and ``pandas.eval`` precedence rules, so the condition has
+    the same meaning under both. The returned function accepts a mapping
+    from names to column ``Series`` and returns a (newly allocated) boolean array,
+    raising ``_UnsupportedColumnType`` if a column used as a logical operand is not
+    of boolean type. Returns ``None`` if the condition is not of a supported form.
+    """
+    if isinstance(node, ast.BinOp) and type(node.op) in _LOGICAL_UFUNCS:
+        left = _compile_array_expression(node.left)
+        right = _compile_array_expression(node.right)
+        if left is None or right is None:
+            return None
+        ufunc = _LOGICAL_UFUNCS[type(node.op)]
+
+        def evaluate(column_resolvers):
+            mask = left(column_resolvers)
+            return ufunc(mask, right(column_resolvers), out=mask)
+
+    elif isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.Invert):
+        operand = _compile_array_expression(node.operand)
+        if operand is None:
+            return None
+
+        def evaluate(column_resolvers):
+            mask = operand(column_resolvers)
+            return np.logical_not(mask, out=mask)
+
+    elif isinstance(node, ast.Name):
+        name = node.id
+
+        def evaluate(column_resolvers):
+            if column_resolvers[name].dtype != bool:
+                raise _UnsupportedColumnType(name)
+            return column_resolvers.array(name).copy()
+
+    else:
+        structured_condition = _structure_node(node)
+        if structured_condition is None:
+            return None
+        return _compile_condition(*structured_condition)
+
+    return evaluate
+
+
+def _compile_expression(
+    expression: str,
+) -> Callable[[Dict[str, pd.Series]], np.ndarray]:
+    """Create a function evaluating an expression string on a mapping of columns.
+
+    Compound conditions of a form supported by ``_compile_array_expression`` are
+    evaluated directly on NumPy arrays. All other expressions are evaluated with
+    ``pandas.eval``, as the operator precedence used by ``pandas.eval`` differs from
+    that of Python (``&`` and ``|`` bind less tightly than comparisons in
+    ``pandas.eval``) and so evaluating these expressions as Python code would change
+    their meaning.
+    """
+    def evaluate_with_pandas(column_resolvers):
+        return np.array(
+            pd.eval(expression, resolvers=(column_resolvers,), engine="python"),
+            dtype=bool,
+        )
+
+    try:
+        tree = ast.parse(expression.strip(), mode="eval")
+    except SyntaxError:
+        return evaluate_with_pandas
+
+    evaluate_on_arrays = _compile_array_expression(tree.body)
+    if evaluate_on_arrays is None:
+        return evaluate_with_pandas
+
+    def evaluate(column_resolvers):
+        try:
+            return evaluate_on_arrays(column_resolvers)
+        except _UnsupportedColumnType:
+            return evaluate_with_pandas(column_resolvers)
+
+    return evaluate
+
+
+def _compile_condition(
+    kind: str,
+    column: Optional[str],
+    op: Optional[np.ufunc],
+    operand: Any,
+) -> Callable[[Dict[str, pd.Series]], np.ndarray]:
+    """Create a function evaluating a structured condition on a mapping of columns.
+
+    The returned function accepts a mapping from names to column ``Series`` and
+    returns a (newly allocated) boolean array.
+    """
+    if kind == "expr":
+        return _compile_expression(operand)
+
+    elif kind == "compare":
+        # Categories dtype and corresponding integer code of operand, computed lazily
+        # on first evaluation and recomputed only if the column dtype changes
+        category_code = [None, None]
+
+        def evaluate(column_resolvers):
+            series = column_resolvers[column]
+            if (
+                op in (np.equal, np.not_equal)
+                and isinstance(series.dtype, pd.CategoricalDtype)
+            ):
+                if series.dtype is not category_code[0]:
+                    categories = series.dtype.categories
+                    category_code[0] = series.dtype
+                    category_code[1] = (
+                        categories.get_loc(operand) if operand in categories else None
+                    )
+                if category_code[1] is not None:
+                    # Compare integer category codes rather than category values
+                    return op(series.array.codes, category_code[1])
+            elif not isinstance(series.dtype, pd.CategoricalDtype):
+                try:
+                    return op(column_resolvers.array(column), operand)
+                except TypeError:
+                    # No NumPy loop for comparing these types (for example integer
+                    # array and string operand) so defer to pandas element-wise
+                    # comparison semantics
+                    pass
+            # For categoricals defer to pandas so semantics of ordered categories
+            # are respected
+            return np.array(op(series, operand), dtype=bool)
+
+    elif kind == "range":
+        low, high = operand
+
+        def evaluate(column_resolvers):
+            series = column_resolvers[column]
+            if not isinstance(series.dtype, pd.CategoricalDtype):
+                values = column_resolvers.array(column)
+                try:
+                    mask = np.greater_equal(values, low)
+                    mask &= np.less_equal(values, high)
+                    return mask
+                except TypeError:
+                    # No NumPy loop for comparing these types (for example datetime
+                    # array and string bounds) so defer to pandas
+                    pass
+            return series.between(low, high).to_numpy(dtype=bool)
+
+    elif kind == "isin":
+        def evaluate(column_resolvers):
+            return column_resolvers[column].isin(operand).to_numpy(dtype=bool)
+
+    elif kind == "isna":
+        def evaluate(column_resolvers):
+            return pd.isna(column_resolvers.array(column))
+
+    else:
+        raise ValueError(f"Unknown condition kind: {kind}")
+
+    return evaluate
+
+
+def _get_interval_column(conditions: List[Tuple]) -> Optional[str]:
+    """Get column name if conditions all define intervals of values of one column.
+
+    Returns ``None`` unless there are at least two conditions, all of which are
+    comparisons (other than inequality) or ranges with real number operands on the
+    same column, in which case the predictor output is a piecewise constant function
+    of the column value.
+    """
+    if len(conditions) < 2:
+        return None
+    column = conditions[0][1]
+    for kind, condition_column, op, operand, _ in conditions:
+        operands = operand if kind == "range" else (operand,)
+        if not (
+            kind in ("compare", "range")
+            and condition_column == column
+            and op is not np.not_equal
+            and all(
+                isinstance(x, numbers.Real) and not isinstance(x, bool)
+                for x in operands
+            )
+        ):
+            return None
+    return column
+
+
+def _compile_interval_lookup(
+    column: str,
+    conditions: List[Tuple],
+    evaluate_conditions: Callable[[Dict[str, pd.Series], int], np.ndarray],
+) -> Optional[Callable[[Dict[str, pd.Series], int], np.ndarray]]:
+    """Create a function evaluating interval conditions on a column in a single pass.
+
+    For integer endpoints, the predictor output for integer column values is fully
+    determined by its value at each integer from one below the smallest endpoint to
+    one above the largest endpoint, with values outside this range taking the value
+    at the nearest end. These outputs are computed once by applying
+    ``evaluate_conditions`` to the range of integers, with the output for each row
+    then looked up from this table. This avoids computing a separate mask for each
+    condition. Columns with non-integer values fall back to ``evaluate_conditions``.
+
+    Returns ``None`` if the endpoints are not all integers or span a range larger
+    than ``_MAX_INTERVAL_LOOKUP_TABLE_SIZE``.
+    """
+    endpoints = [
+        x for kind, _, _, operand, _ in conditions
+        for x in (operand if kind == "range" else (operand,))
+    ]
+    if not all(float(x).is_integer() for x in endpoints):
+        return None
+    low, high = int(min(endpoints)) - 1, int(max(endpoints)) + 1
+    if high - low >= _MAX_INTERVAL_LOOKUP_TABLE_SIZE:
+        return None
+    table_points = np.arange(low, high + 1)
+    lookup_table = evaluate_conditions(
+        _ColumnResolvers({column: pd.Series(table_points)}), len(table_points)
+    )
+
+    def evaluate(column_resolvers, n_rows, scratch=None):
+        values = column_resolvers.array(column)
+        if values.dtype.kind not in "iu":
+            return evaluate_conditions(column_resolvers, n_rows, scratch)
+        index = np.subtract(values, low, dtype=np.intp)
+        np.minimum(index, high - low, out=index)
+        np.maximum(index, 0, out=index)
+        return lookup_table[index]
+
+    return evaluate
+
 
 class Predictor(object):
 
@@ -58,6 +447,7 @@ class Predictor(object):
             self.property_name = f'__{self.property_name}__'
 
         self.conditions = list()
+        self._structured_conditions = list()
         self.callback = None
         self.has_otherwise = False
         self.conditions_are_mutually_exclusive = conditions_are_mutually_exclusive
@@ -88,7 +478,7 @@ class Predictor(object):
         # If there isn't a property name
         if self.property_name is None:
             # We use the supplied condition literally
-            self.conditions.append((condition, coefficient))
+            self._append_condition(condition, coefficient)
             return self
 
         # Otherwise, the condition is applied on a specific property
@@ -102,13 +492,15 @@ class Predictor(object):
                     parsed_condition = f'({self.property_name} == {condition})'
                 else:
                     parsed_condition = f'({self.property_name} == "{condition}")'
-        elif isinstance(condition, bool):
-            if condition:
-                parsed_condition = f'({self.property_name} == True)'
-            else:
-                parsed_condition = f'({self.property_name} == False)'
         elif isinstance(condition, numbers.Number):
-            parsed_condition = f'({self.property_name} == {condition})'
+            # Covers booleans as well as numeric values. The structured form of the
+            # equality condition is constructed directly rather than by parsing it
+            self._append_condition(
+                f'({self.property_name} == {condition})',
+                coefficient,
+                ("compare", self.property_name, np.equal, condition),
+            )
+            return self
         elif condition is None:
             assert not self.has_otherwise, "You can only give one unconditioned value to predictor"
             self.has_otherwise = True
@@ -116,9 +508,157 @@ class Predictor(object):
         else:
             raise RuntimeError(f"Unhandled condition: {condition}")
 
-        self.conditions.append((parsed_condition, coefficient))
+        self._append_condition(parsed_condition, coefficient)
         return self
 
+    def _append_condition(
+        self,
+        parsed_condition: Optional[str],
+        coefficient,
+        structured_condition: Optional[Tuple] = None,
+    ) -> None:
+        """Store a parsed condition string and its structured form for evaluation.
+
+        The structured form is a tuple ``(kind, column, op, operand, value)`` used by
+        ``predict`` to evaluate the condition directly on NumPy arrays where possible.
+        If ``structured_condition`` is not specified, the ``(kind, column, op,
+        operand)`` part of the tuple is generated by parsing ``parsed_condition``.
+        """
+        if structured_condition is None:
+            structured_condition = _structure_condition(parsed_condition)
+        _check_structured_condition(structured_condition)
+        self.conditions.append((parsed_condition, coefficient))
+        self._structured_conditions.append(structured_condition + (coefficient,))
+
+    def compile(
+        self, null_value: Union[float, int]
+    ) -> Callable[[Dict[str, pd.Series], int], np.ndarray]:
+        """Create a function evaluating the predictor output for each row.
+
+        All processing of the predictor conditions which does not depend on the data
+        is done once here, so that the returned function can be called repeatedly.
+
+        Conditions are applied sequentially, with each row taking the value of the
+        first condition it matches (or of any condition it matches if the conditions
+        are declared mutually exclusive). Rows matching no condition are assigned
+        ``null_value``, unless an ``otherwise`` value has been specified.
+
+        :param null_value: Value corresponding to no effect on the model output.
+        :return: Function accepting a mapping from names used in the predictor
+            conditions to the corresponding column ``Series``, the number of rows and
+            optionally a pair of boolean scratch arrays of length equal to the number
+            of rows to use when evaluating conditions (allowing the arrays to be
+            shared across predictors), and returning an array of the predictor output
+            values.
+        """
+        if self.callback is not None:
+            property_name, callback = self.property_name, self.callback
+
+            def evaluate(column_resolvers, n_rows, scratch=None):
+                return column_resolvers[property_name].apply(callback).to_numpy()
+
+            return evaluate
+
+        conditions, default = self._get_conditions_and_default(null_value)
+        values = tuple(value for *_, value in conditions)
+        dtype = np.result_type(default, *values)
+        condition_masks = tuple(
+            _compile_condition(kind, column, op, operand)
+            for kind, column, op, operand, _ in conditions
+        )
+        mutually_exclusive = bool(self.conditions_are_mutually_exclusive)
+
+        def evaluate(column_resolvers, n_rows, scratch=None):
+            # Output is returned to the caller so is always freshly allocated
+            output = np.full(n_rows, default, dtype=dtype)
+            if not mutually_exclusive:
+                if scratch is None:
+                    touched = np.zeros(n_rows, dtype=bool)
+                    not_touched = np.empty(n_rows, dtype=bool)
+                else:
+                    touched, not_touched = scratch
+                    touched.fill(False)
+            n_touched = 0
+            for condition_mask, value in zip(condition_masks, values):
+                mask = condition_mask(column_resolvers)
+                if not mutually_exclusive:
+                    # Restrict to rows not matching any previous conditions
+                    np.logical_not(touched, out=not_touched)
+                    np.logical_and(mask, not_touched, out=mask)
+                    np.logical_or(touched, mask, out=touched)
+                    n_touched += np.count_nonzero(mask)
+                # Write value in place without boolean mask indexing overhead
+                np.putmask(output, mask, value)
+                if n_touched == n_rows:
+                    # All rows matched so remaining conditions cannot change output
+                    break
+            return output
+
+        interval_column = _get_interval_column(conditions)
+        if interval_column is not None:
+            interval_lookup = _compile_interval_lookup(
+                interval_column, conditions, evaluate
+            )
+            if interval_lookup is not None:
+                return interval_lookup
+        return evaluate
+
+    def _get_conditions_and_default(
+        self, null_value: Union[float, int]
+    ) -> Tuple[List[Tuple], Union[float, int]]:
+        """Get the structured conditions which need to be evaluated and default value.
+
+        Conditions which can be determined without evaluating them to either never
+        match or to match all rows are resolved here, with the value of the first
+        condition matching all rows not matched by previous conditions used as the
+        default value for unmatched rows.
+        """
+        conditions = []
+        for condition in self._structured_conditions:
+            kind, _, _, operand, value = condition
+            if kind == "const" and not operand:
+                # Condition never matches so can be ignored
+                continue
+            if kind in ("else", "const"):
+                # An 'otherwise' (or always true) condition matches all rows not so
+                # far matched, therefore any conditions after it can be ignored and
+                # its value used as the default
+                return conditions, value
+            conditions.append(condition)
+        if self.conditions_are_exhaustive and len(conditions) > 0:
+            # All rows not matched by the previous conditions are guaranteed to
+            # match the last condition so it does not need to be evaluated
+            return conditions[:-1], conditions[-1][-1]
+        return conditions, null_value
+
+    def _get_constant_output(
+        self, null_value: Union[float, int]
+    ) -> Optional[Union[float, int]]:
+        """Get the predictor output if it is the same for all rows, else ``None``."""
+        if self.callback is not None:
+            return None
+        conditions, default = self._get_conditions_and_default(null_value)
+        return default if len(conditions) == 0 else None
+
+    def predict(
+        self,
+        column_resolvers: Dict[str, pd.Series],
+        n_rows: int,
+        null_value: Union[float, int],
+    ) -> np.ndarray:
+        """Evaluate the predictor output for each row.
+
+        Equivalent to ``self.compile(null_value)(column_resolvers, n_rows)``. If the
+        predictor will be evaluated repeatedly, compile it once and reuse the returned
+        function instead.
+
+        :param column_resolvers: Mapping from names used in the predictor conditions
+            to the corresponding column ``Series``.
+        :param n_rows: Number of rows to evaluate the predictor for.
+        :param null_value: Value corresponding to no effect on the model output.
+        """
+        return self.compile(null_value)(_ColumnResolvers(column_resolvers), n_rows)
+
     def __str__(self):
         if self.property_name and self.property_name.startswith('__'):
             name = f'{self.property_name.strip("__")} (external)'
@@ -187,6 +727,7 @@ class LinearModel(object):
         )
 
         self._parse_predictors()
+        self._compile_predictors()
 
     @property
     def lm_type(self) -> LinearModelType:
@@ -244,100 +785,60 @@ class LinearModel(object):
         return custom_model
 
     def _parse_predictors(self):
-        """Set model string, callback predictors and predictor names from predictors.
+        """Set predictor names from predictors.
 
-        Sets `self._model_string` to an expression string (to be evaluated by
-        ``pandas.DataFrame.eval``) corresponding to the evaluation of the model output
-        for the subset of the predictors which do not define a custom callback function
-        and the model intercept, or an empty string if no non-callback predictors are
-        present.
-
-        Additionally sets `self._callback_predictors` to a tuple of the omitted
-        predictors with custom callback functions and `self._predictor_names` to a set
-        of strings corresponding to names specified in the predictors.
+        Sets `self._predictor_names` to a set of strings corresponding to names
+        specified in the predictors.
+        """
+        self._predictor_names = set()
+        for predictor in self.predictors:
+            if predictor.property_name is not None:
+                self._predictor_names.add(predictor.property_name)
+            else:
+                # If no property_name specified, predictor conditions will
+                # contain one or more column names therefore parse condition
+                # strings and filter for all name nodes. This will also
+                # add non-column names such as builtin functions so need to
+                # check if names are actually columns before using
+                for condition, _ in predictor.conditions:
+                    self._predictor_names.update(
+                        node.id for node in ast.walk(ast.parse(condition))
+                        if isinstance(node, ast.Name)
+                    )
+
+    def _compile_predictors(self):
+        """Compile predictors to functions evaluating their output.
+
+        Sets `self._compiled` to a tuple of functions, one per predictor with output
+        varying between rows, as returned by ``Predictor.compile``. The outputs of
+        predictors which are constant across all rows are instead combined with the
+        intercept once here and stored in ``self._constant_output``.
         """
         # For additive models a zero coefficient corresponds to no effect while for
         # multiplicative and logistic models the relevant value is one
         null_coeff_value = 0 if self.lm_type == LinearModelType.ADDITIVE else 1
-        predictor_strings = []
-        callback_predictors = []
-        self._predictor_names = set()
+        compiled = []
+        self._constant_output = self.intercept
         for predictor in self.predictors:
-            if predictor.callback is None:
-                if predictor.property_name is not None:
-                    self._predictor_names.add(predictor.property_name)
-                else:
-                    # If no property_name specified, predictor conditions will
-                    # contain one or more column names therefore parse condition
-                    # strings and filter for all name nodes. This will also
-                    # add non-column names such as builtin functions so need to
-                    # check if names are actually columns before using
-                    for condition, _ in predictor.conditions:
-                        self._predictor_names.update(
-                            node.id for node in ast.walk(ast.parse(condition))
-                            if isinstance(node, ast.Name)
-                        )
-                has_catch_all_condition = False
-                for i, (condition, value) in enumerate(predictor.conditions):
-                    if i == 0:
-                        if condition is None:
-                            # 'otherwise' fallback condition - always True. If used as
-                            # first condition any other conditions will be ignored as
-                            # this condition matches all
-                            predictor_str = f"{value}"
-                            any_prev_conds = "True"
-                            has_catch_all_condition = True
-                            break
-                        else:
-                            predictor_str = f"({condition}) * {value}"
-                            any_prev_conds = f"{condition}"
-                    else:
-                        if condition is None:
-                            # 'otherwise' fallback condition - matches all not
-                            # so far matched therefore can ignore any remaining
-                            # conditions
-                            predictor_str += f" + (~({any_prev_conds})) * {value}"
-                            has_catch_all_condition = True
-                            break
-                        elif predictor.conditions_are_mutually_exclusive:
-                            # conditions have been declared to be mutually exclusive
-                            # therefore we can just multiply conditions by coefficient
-                            # values as condition == ~any_prev_conds & condition
-                            predictor_str += f" + ({condition}) * {value}"
-                            any_prev_conds += f" | {condition}"
-
-                        else:
-                            # conditions are potentially non-mutually exclusive and
-                            # are applied sequentially in order specified on subset
-                            # not matching any previous conditions
-                            predictor_str += (
-                                f" + (~({any_prev_conds}) & {condition}) * {value}")
-                            any_prev_conds += f" | {condition}"
-                # If the predictor neither declares that the conditions are exhaustive
-                # (i.e. all cases are covered an any_prev_conds is guaranteed to be
-                # True) nor an 'otherwise' catch-all condition has been used (in which
-                # case any_prev_conds is also guaranteed to be True) then add term
-                # corresponding to no effect when no previous conditions matched
-                if not (predictor.conditions_are_exhaustive or has_catch_all_condition):
-                    predictor_str += f" + ~({any_prev_conds}) * {null_coeff_value}"
-                predictor_strings.append(f"({predictor_str})")
+            constant_output = predictor._get_constant_output(null_coeff_value)
+            if constant_output is None:
+                compiled.append(predictor.compile(null_coeff_value))
+            elif self.lm_type == LinearModelType.ADDITIVE:
+                self._constant_output += constant_output
             else:
-                self._predictor_names.add(predictor.property_name)
-                callback_predictors.append(predictor)
-
-        self._callback_predictors = tuple(callback_predictors)
+                self._constant_output *= constant_output
+        self._compiled = tuple(compiled)
 
-        if len(predictor_strings) > 0:
+    def __getstate__(self):
+        # Compiled predictor functions are closures which cannot be pickled so are
+        # excluded from the pickled state and recompiled when unpickling
+        state = self.__dict__.copy()
+        del state["_compiled"], state["_constant_output"]
+        return state
 
-            if self.intercept != null_coeff_value:
-                # Only need to include intercept if its non-zero in additive models
-                # or non-unity in multiplicative/logistic models
-                predictor_strings.append(f"{self.intercept}")
-
-        if self.lm_type == LinearModelType.ADDITIVE:
-            self._model_string = " + ".join(predictor_strings)
-        else:
-            self._model_string = " * ".join(predictor_strings)
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._compile_predictors()
 
     def _get_column_resolvers(
         self,
@@ -355,7 +856,7 @@ class LinearModel(object):
         subset are used in each linear model. Any external variables specified in
         predictors are also included with dunder-wrapped keys (e.g '__ext_var__').
         """
-        column_resolvers = {}
+        column_resolvers = _ColumnResolvers()
         for name in self._predictor_names:
             # predictor_names may contain built-in names that are not columns
             # therefore we need to check if name is column in dataframe
@@ -418,37 +919,33 @@ class LinearModel(object):
 
         column_resolvers = self._get_column_resolvers(df, **kwargs)
 
-        if self._model_string != "":
-            result = pd.eval(
-                self._model_string,
-                resolvers=(column_resolvers,),
-                engine="python"
-            )
-        else:
-            result = pd.Series(data=self.intercept, index=df.index)
-
-        if len(self._callback_predictors) > 0:
-            callback_results = [
-                column_resolvers[p.property_name].apply(p.callback)
-                for p in self._callback_predictors
-            ]
-            if self.lm_type == LinearModelType.ADDITIVE:
-                result += sum(callback_results)
-            else:
-                result *= prod(callback_results)
-
-        # Ensure result of floating point type even if all predictor coefficients
-        # are integer but intercept is floating point
-        if isinstance(self.intercept, float) and result.dtype == int:
-            result = result.astype(float)
-        # Result series sometimes picks up name from one of predictors - set to
-        # None so comparisons with unnamed series in tests pass
-        result.name = None
+        # Accumulate predictor outputs in place in a single array rather than
+        # materialising the output of each predictor as a separate series
+        accumulate = (
+            np.add if self.lm_type == LinearModelType.ADDITIVE else np.multiply
+        )
+        result = np.full(len(df), self._constant_output)
+        # Scratch arrays for evaluating predictor conditions, shared by all predictors
+        # for this call only
+        scratch = (np.empty(len(df), dtype=bool), np.empty(len(df), dtype=bool))
+        for evaluate_predictor in self._compiled:
+            predictor_output = evaluate_predictor(column_resolvers, len(df), scratch)
+            if not np.can_cast(predictor_output.dtype, result.dtype):
+                # Integer intercept with floating point coefficients
+                result = result.astype(np.result_type(result, predictor_output))
+            accumulate(result, predictor_output, out=result)
 
         if self.lm_type == LinearModelType.LOGISTIC:
             # Below is equivalent to result = result / (1 + result) but will give correct
             # output where any elements in result are inf (--> 1.0) or 0.0 (--> 0.0).
-            result = (1 / (1 + 1 / result))
+            # The operations are applied in place to avoid allocating temporary arrays.
+            result = result.astype(np.float64, copy=False)
+            with np.errstate(divide="ignore"):
+                np.reciprocal(result, out=result)
+                result += 1
+                np.reciprocal(result, out=result)
+
+        result = pd.Series(result, index=df.index, copy=False)
 
         # If the user supplied a random number generator then they want outcomes,
         # not probabilities
@@ -3,10 +3,18 @@ import logging as _logging
 from collections import defaultdict
 from typing import Any, DefaultDict, Dict, List
 
-import numpy as np
 import pandas as pd
 
 
+def _parse_dates(dates) -> pd.Series:
+    """Convert a sequence of ISO 8601 formatted date strings to a datetime series.
+
+    Parsed values are cached so repeated dates, as is typical for log dates, are only
+    parsed once.
+    """
+    return pd.to_datetime(pd.Series(dates, dtype=object), format="ISO8601", cache=True)
+
+
 class LogData:
     """Builds up log data for export as dictionary with dataframes"""
 
@@ -54,12 +62,12 @@ class LogData:
                 else:
                     output_logs[module][key] = pd.DataFrame(data['values'], columns=data['header']['columns'].keys())
                     output_logs[module][key].insert(
-                        0, "date", pd.Series(data["dates"], dtype=np.dtype('datetime64[ns]'))
+                        0, "date", _parse_dates(data["dates"])
                     )
                 # for each column, cast to the correct type if necessary
                 for n, t in data['header']['columns'].items():
                     if t == "Timestamp":
-                        output_logs[module][key][n] = output_logs[module][key][n].astype('datetime64[ns]')
+                        output_logs[module][key][n] = _parse_dates(output_logs[module][key][n])
                     elif t == "Categorical":
                         output_logs[module][key][n] = output_logs[module][key][n].astype('category')
                     elif t == "set":
@@ -82,7 +90,7 @@ class LogData:
                         # the index for each row of the logged dataframe
                         for df_row_i in log_row.keys()}
         # create dataframe from indexed data, and join dates based on the log row index
-        log_date = pd.DataFrame(pd.Series(dates, name='date', dtype=np.dtype('datetime64[ns]')))
+        log_date = pd.DataFrame(_parse_dates(dates).rename('date'))
         log_date.index.set_names("log_row", inplace=True)
         logged_df = pd.DataFrame.from_dict(indexed_data, orient='index')
         logged_df.index.set_names(['log_row', 'df_row'], inplace=True)
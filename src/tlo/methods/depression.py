@@ -18,6 +18,7 @@ from tlo.methods.dxmanager import DxTest
 from tlo.methods.hsi_event import HSI_Event
 from tlo.methods.hsi_generic_first_appts import GenericFirstAppointmentsMixin
 from tlo.methods.symptommanager import Symptom
+from tlo.util import get_year
 
 if TYPE_CHECKING:
     from tlo.methods.hsi_generic_first_appts import DiagnosisFunction, HSIEventScheduler
@@ -1076,13 +1077,13 @@ def compute_key_outputs_for_last_3_years(parsed_output):
 
     # Process the event outputs from the model
     depr_events = parsed_output['tlo.methods.depression']['event_counts']
-    depr_events['year'] = pd.to_datetime(depr_events['date']).dt.year
+    depr_events['year'] = get_year(depr_events['date'])
     depr_events = depr_events.groupby(by='year')[['SelfHarmEvents', 'SuicideEvents']].sum()
 
     # Get population sizes for the
     def get_15plus_pop_by_year(df):
         df = df.copy()
-        df['year'] = pd.to_datetime(df['date']).dt.year
+        df['year'] = get_year(df['date'])
         df.drop(columns='date', inplace=True)
         df.set_index('year', drop=True, inplace=True)
         cols_for_15plus = [int(x[0]) >= 15 for x in df.columns.str.strip('+').str.split('-')]
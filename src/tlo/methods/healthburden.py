@@ -19,6 +19,7 @@ from tlo.methods.causes import (
     get_gbd_causes_not_represented_in_disease_modules,
 )
 from tlo.methods.demography import age_at_date
+from tlo.util import get_year
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
@@ -387,20 +388,26 @@ class HealthBurden(Module):
         :return: a dataframe (X) of the person-time (in years) spent by age-group and time-period
         """
 
-        df = pd.DataFrame()
-
         # Get all the days between start and end (inclusively)
-        df['days'] = pd.date_range(start=start_date, end=end_date, freq='D')
-        df['year'] = df['days'].dt.year
+        days = pd.date_range(start=start_date, end=end_date, freq='D')
+        year = get_year(days)
 
         # Get the age (in whole years) that this person will be on each day.
         # N.B. This is a slight approximation as it doesn't make allowance for leap-years.
-        df['age_in_years'] = age_at_date(df['days'], date_of_birth).astype(int)
+        age_in_years = age_at_date(days, date_of_birth).astype(int)
 
-        age_range_lookup = self.sim.modules['Demography'].AGE_RANGE_LOOKUP  # get the age_range_lookup from demography
-        df['age_range'] = df['age_in_years'].map(age_range_lookup)
+        # Count the days spent in each pair of year and age (in whole years), encoded as a single integer key, so
+        # that only these unique pairs rather than every day need to be mapped to age-ranges and grouped. The key
+        # encoding requires ages to be in range [0, 1000), so the period must not start before the date of birth.
+        assert ((age_in_years >= 0) & (age_in_years < 1000)).all(), "Ages during period must be in range [0, 1000)"
+        year_and_age, n_days = np.unique(year * 1000 + age_in_years, return_counts=True)
 
-        period = pd.DataFrame(df.groupby(by=['year', 'age_range'])['days'].count())
+        age_range_lookup = self.sim.modules['Demography'].AGE_RANGE_LOOKUP  # get the age_range_lookup from demography
+        period = pd.DataFrame({
+            'year': (year_and_age // 1000).astype(np.int32),
+            'age_range': pd.Series(year_and_age % 1000).map(age_range_lookup),
+            'days': n_days,
+        }).groupby(by=['year', 'age_range'])[['days']].sum()
         period['person_years'] = (period['days'] / 365).clip(lower=0.0, upper=1.0)
 
         period.drop(columns=['days'], axis=1, inplace=True)
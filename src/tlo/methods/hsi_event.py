@@ -156,12 +156,14 @@ class HSI_Event:
         """Called when this event is due but it is not run. Return False to prevent the event being rescheduled, or True
         to allow the rescheduling. This is called each time that the event is tried to be run but it cannot be.
         """
-        logger.debug(key="message", data=f"{self.__class__.__name__}: did not run.")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(key="message", data=f"{self.__class__.__name__}: did not run.")
         return True
 
     def never_ran(self) -> None:
         """Called when this event is was entered to the HSI Event Queue, but was never run."""
-        logger.debug(key="message", data=f"{self.__class__.__name__}: was never run.")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(key="message", data=f"{self.__class__.__name__}: was never run.")
 
     def post_apply_hook(self) -> None:
         """Do any required processing after apply() completes."""
@@ -415,6 +415,15 @@ def str_to_pandas_date(date_string):
     return pd.to_datetime(date_string, format="%Y-%m-%d")
 
 
+def get_year(dates: Union[pd.Series, pd.DatetimeIndex, np.ndarray]) -> np.ndarray:
+    """Get the calendar year of each of an array of dates (without missing values).
+
+    Equivalent to ``dates.dt.year`` for a ``pd.Series`` of dates, but computed by casting the underlying ``datetime64``
+    values to years since the epoch, avoiding the construction of the ``.dt`` accessor and intermediate series.
+    """
+    return np.asarray(dates, dtype="datetime64[Y]").astype(int) + 1970
+
+
 def hash_dataframe(dataframe: pd.DataFrame):
     def coerce_lists_to_tuples(df: pd.DataFrame) -> pd.DataFrame:
         """Coerce columns in a pd.DataFrame that are lists to tuples. This step is needed before hashing a pd.DataFrame
@@ -4,6 +4,7 @@ import os
 from pathlib import Path
 
 import pandas as pd
+import pytest
 
 from tlo import Date, Simulation
 from tlo.methods import (
@@ -27,6 +28,29 @@ scaleup_start_year = 2012  # <-- the scale-up will occur on 1st January of that
 end_date = Date(2013, 1, 1)
 
 
+@pytest.fixture(scope="module")
+def hiv_resource_sheets():
+    """Sheets of the HIV resource file used in tests, read once for all tests."""
+    return pd.read_excel(resourcefilepath / 'ResourceFile_HIV.xlsx', sheet_name=["parameters", "scaleup_parameters"])
+
+
+@pytest.fixture(scope="module")
+def tb_resource_sheets():
+    """Sheets of the TB resource file used in tests, read once for all tests."""
+    return pd.read_excel(
+        resourcefilepath / 'ResourceFile_TB.xlsx', sheet_name=["parameters", "NTP2019", "scaleup_parameters"]
+    )
+
+
+@pytest.fixture(scope="module")
+def malaria_resource_sheets():
+    """Sheets of the malaria resource file used in tests, read once for all tests."""
+    return pd.read_excel(
+        resourcefilepath / 'malaria' / 'ResourceFile_malaria.xlsx',
+        sheet_name=["parameters", "WHO_TestData2023", "scaleup_parameters"]
+    )
+
+
 def get_sim(seed):
     """
     register all necessary modules for the tests to run
@@ -52,9 +76,7 @@ def get_sim(seed):
     return sim
 
 
-def check_initial_params(sim):
-
-    original_params = pd.read_excel(resourcefilepath / 'ResourceFile_HIV.xlsx', sheet_name='parameters')
+def check_initial_params(sim, original_params):
 
     # check initial parameters
     assert sim.modules["Hiv"].parameters["beta"] == \
@@ -69,19 +91,19 @@ def check_initial_params(sim):
         original_params.parameter_name == "prob_circ_after_hiv_test", "value"].values[0]
 
 
-def test_hiv_scale_up(seed):
+def test_hiv_scale_up(seed, hiv_resource_sheets, tb_resource_sheets, malaria_resource_sheets):
     """ test hiv program scale-up changes parameters correctly
     and on correct date """
 
-    original_params = pd.read_excel(resourcefilepath / 'ResourceFile_HIV.xlsx', sheet_name="parameters")
-    new_params = pd.read_excel(resourcefilepath / 'ResourceFile_HIV.xlsx', sheet_name="scaleup_parameters")
+    original_params = hiv_resource_sheets["parameters"]
+    new_params = hiv_resource_sheets["scaleup_parameters"]
 
     popsize = 100
 
     sim = get_sim(seed=seed)
 
     # check initial parameters
-    check_initial_params(sim)
+    check_initial_params(sim, hiv_resource_sheets["parameters"])
 
     # update parameters to instruct there to be a scale-up
     sim.modules["Hiv"].parameters["type_of_scaleup"] = 'target'
@@ -104,10 +126,8 @@ def test_hiv_scale_up(seed):
         new_params.parameter == "prob_circ_after_hiv_test", "target_value"].values[0]
 
     # check malaria parameters unchanged
-    mal_original_params = pd.read_excel(resourcefilepath / 'malaria' / 'ResourceFile_malaria.xlsx',
-                                        sheet_name="parameters")
-    mal_rdt_testing = pd.read_excel(resourcefilepath / 'malaria' / 'ResourceFile_malaria.xlsx',
-                                    sheet_name="WHO_TestData2023")
+    mal_original_params = malaria_resource_sheets["parameters"]
+    mal_rdt_testing = malaria_resource_sheets["WHO_TestData2023"]
 
     assert sim.modules["Malaria"].parameters["prob_malaria_case_tests"] == mal_original_params.loc[
         mal_original_params.parameter_name == "prob_malaria_case_tests", "value"].values[0]
@@ -121,8 +141,8 @@ def test_hiv_scale_up(seed):
         mal_original_params.parameter_name == "itn", "value"].values[0]
 
     # check tb parameters unchanged
-    tb_original_params = pd.read_excel(resourcefilepath / 'ResourceFile_TB.xlsx', sheet_name="parameters")
-    tb_testing = pd.read_excel(resourcefilepath / 'ResourceFile_TB.xlsx', sheet_name="NTP2019")
+    tb_original_params = tb_resource_sheets["parameters"]
+    tb_testing = tb_resource_sheets["NTP2019"]
 
     pd.testing.assert_series_equal(sim.modules["Tb"].parameters["rate_testing_active_tb"]["treatment_coverage"],
                                    tb_testing["treatment_coverage"])
@@ -138,20 +158,20 @@ def test_hiv_scale_up(seed):
         tb_original_params.parameter_name == "first_line_test", "value"].values[0]
 
 
-def test_htm_scale_up(seed):
+def test_htm_scale_up(seed, hiv_resource_sheets, tb_resource_sheets, malaria_resource_sheets):
     """ test hiv/tb/malaria program scale-up changes parameters correctly
     and on correct date """
 
     # Load data on HIV prevalence
-    original_hiv_params = pd.read_excel(resourcefilepath / 'ResourceFile_HIV.xlsx', sheet_name="parameters")
-    new_hiv_params = pd.read_excel(resourcefilepath / 'ResourceFile_HIV.xlsx', sheet_name="scaleup_parameters")
+    original_hiv_params = hiv_resource_sheets["parameters"]
+    new_hiv_params = hiv_resource_sheets["scaleup_parameters"]
 
     popsize = 100
 
     sim = get_sim(seed=seed)
 
     # check initial parameters
-    check_initial_params(sim)
+    check_initial_params(sim, hiv_resource_sheets["parameters"])
 
     # update parameters
     sim.modules["Hiv"].parameters["type_of_scaleup"] = 'target'
@@ -178,8 +198,7 @@ def test_htm_scale_up(seed):
         new_hiv_params.parameter == "prob_circ_after_hiv_test", "target_value"].values[0]
 
     # check malaria parameters changed
-    new_mal_params = pd.read_excel(resourcefilepath / 'malaria' / 'ResourceFile_malaria.xlsx',
-                                   sheet_name="scaleup_parameters")
+    new_mal_params = malaria_resource_sheets["scaleup_parameters"]
 
     assert sim.modules["Malaria"].parameters["prob_malaria_case_tests"] == new_mal_params.loc[
         new_mal_params.parameter == "prob_malaria_case_tests", "target_value"].values[0]
@@ -193,7 +212,7 @@ def test_htm_scale_up(seed):
         new_mal_params.parameter == "itn", "target_value"].values[0]
 
     # check tb parameters changed
-    new_tb_params = pd.read_excel(resourcefilepath / 'ResourceFile_TB.xlsx', sheet_name="scaleup_parameters")
+    new_tb_params = tb_resource_sheets["scaleup_parameters"]
 
     assert sim.modules["Tb"].parameters["rate_testing_active_tb"]["treatment_coverage"].eq(new_tb_params.loc[
         new_tb_params.parameter == "tb_treatment_coverage", "target_value"].values[0]).all()
@@ -1,5 +1,6 @@
 import io
 import os
+import pickle
 from pathlib import Path
 from textwrap import dedent
 
@@ -46,6 +47,17 @@ def population_dataframe():
     )
 
 
+@pytest.fixture(scope="module")
+def lifestyle_dataframe():
+    """Population dataframe at initialisation of lifestyle, read once for all tests.
+
+    Tests using this fixture must not modify the returned dataframe."""
+    df_file = Path(os.path.dirname(__file__)) / 'resources' / 'df_at_init_of_lifestyle.csv'
+    df = pd.read_csv(df_file)
+    df.set_index('person', inplace=True, drop=True)
+    return df
+
+
 def test_of_example_usage(population_dataframe):
     # Test the use of basic functions using different syntax and model types
 
@@ -235,13 +247,11 @@ def test_callback_with_external_variable(population_dataframe):
                                 2.2000, 2.2000, 2.2000, 1.2000, 1.2000]
 
 
-def test_logistic_application_low_ex():
+def test_logistic_application_low_ex(lifestyle_dataframe):
     # Use an example from lifestyle at initiation: low exercise
 
-    # 1) load a df from a csv file that has is a 'freeze-frame' of for sim.population.props
-    df_file = Path(os.path.dirname(__file__)) / 'resources' / 'df_at_init_of_lifestyle.csv'
-    df = pd.read_csv(df_file)
-    df.set_index('person', inplace=True, drop=True)
+    # 1) use a df loaded from a csv file that is a 'freeze-frame' of sim.population.props
+    df = lifestyle_dataframe
 
     # 2) generate the probabilities from the model in the 'classical' manner
     init_p_low_ex_urban_m = 0.32
@@ -267,13 +277,11 @@ def test_logistic_application_low_ex():
     pd.testing.assert_series_equal(lm_low_ex_probs, low_ex_probs)
 
 
-def test_logistic_application_tob():
+def test_logistic_application_tob(lifestyle_dataframe):
     # Use an example from lifestyle at initiation: tob (tobacco use)
 
-    # 1) load a df from a csv file that has is a 'freeze-frame' of for sim.population.props
-    df_file = Path(os.path.dirname(__file__)) / 'resources' / 'df_at_init_of_lifestyle.csv'
-    df = pd.read_csv(df_file)
-    df.set_index('person', inplace=True, drop=True)
+    # 1) use a df loaded from a csv file that is a 'freeze-frame' of sim.population.props
+    df = lifestyle_dataframe
 
     # 2) generate the probabilities from the model in the 'classical' manner
     init_p_tob_age1519_m_wealth1 = 0.7
@@ -715,3 +723,161 @@ def test_integer_category_column_with_missing_data(population_dataframe):
         predictions_no_otherwise[population_dataframe.li_wealth.isna()]
         == intercept
     ).all()
+
+
+def test_between_condition_on_datetime_column():
+    """Check between conditions with string bounds on datetime columns match pandas"""
+    df = pd.DataFrame({'dt': pd.to_datetime(['2010-06-01', '2013-01-01', '2016-01-01'])})
+    lm = LinearModel(
+        LinearModelType.ADDITIVE,
+        0.0,
+        Predictor('dt').when('.between("2012-01-01","2015-01-01")', 1.)
+    )
+    assert lm.predict(df).tolist() == [0.0, 1.0, 0.0]
+
+
+def test_isin_condition_requires_list_like_values():
+    """Check isin conditions with values which are not list-like are rejected as by pandas"""
+    df = pd.DataFrame({'s': ['a', 'b', 'd']})
+    lm = LinearModel(LinearModelType.ADDITIVE, 0.0, Predictor('s').when('.isin("abc")', 1.))
+    with pytest.raises(TypeError):
+        lm.predict(df)
+    lm = LinearModel(LinearModelType.ADDITIVE, 0.0, Predictor('s').when('.isin(["a", "b"])', 1.))
+    assert lm.predict(df).tolist() == [1.0, 1.0, 0.0]
+
+
+@pytest.fixture
+def hiv_tb_dataframe():
+    rng = np.random.RandomState(8130)
+    n_rows = 2000
+    return pd.DataFrame({
+        'hv_inf': rng.uniform(size=n_rows) < 0.3,
+        'tb_on_ipt': rng.uniform(size=n_rows) < 0.5,
+        'age_years': rng.randint(0, 100, size=n_rows),
+        'hv_art': pd.Categorical(
+            rng.choice(['not', 'on_VL_suppressed', 'on_not_VL_suppressed'], size=n_rows)
+        ),
+        'n_doses': rng.randint(0, 3, size=n_rows),
+    })
+
+
+@pytest.mark.parametrize(
+    'condition',
+    [
+        # Conditions as used in tb.py, which rely on the operator precedence used by
+        # pandas.eval, where & binds less tightly than comparisons
+        '~hv_inf &tb_on_ipt & age_years <= 15',
+        '~hv_inf &tb_on_ipt & age_years > 15',
+        'hv_inf & (hv_art == "on_VL_suppressed") &~tb_on_ipt & age_years <= 15',
+        'hv_inf & (hv_art == "on_VL_suppressed") &~tb_on_ipt & age_years > 15',
+        'tb_on_ipt & hv_inf & age_years <= 15 &(hv_art == "on_VL_suppressed")',
+        'tb_on_ipt & hv_inf & age_years > 15 &(hv_art != "on_VL_suppressed")',
+        'tb_on_ipt & age_years <= 15',
+        'age_years < 20 | age_years > 50',
+        'hv_art == "on_VL_suppressed" & age_years > 5',
+        'hv_inf & age_years.between(15, 49) & hv_art != "not"',
+        '~tb_on_ipt & n_doses > 1 | age_years < 2',
+        # Logical operators combining parenthesised simple conditions and boolean
+        # columns, which are evaluated directly on arrays
+        '(age_years > 15) & hv_inf',
+        '~hv_inf | (hv_art == "on_VL_suppressed")',
+        '~(age_years.between(5, 14)) & ~tb_on_ipt',
+        'hv_inf & (hv_art.isin(["not", "on_not_VL_suppressed"])) | (age_years < 5)',
+        '(tb_on_ipt | hv_inf) & ~(age_years >= 50)',
+        # Non-boolean column used as logical operand
+        'n_doses & (age_years < 30)',
+        '~n_doses | hv_inf',
+    ]
+)
+def test_compound_conditions_match_pandas_eval(hiv_tb_dataframe, condition):
+    """Check output for conditions combined with logical operators matches pandas.eval"""
+    lm = LinearModel(LinearModelType.MULTIPLICATIVE, 1.0, Predictor().when(condition, 0.5))
+    expected = np.where(hiv_tb_dataframe.eval(condition, engine='python'), 0.5, 1.0)
+    assert (lm.predict(hiv_tb_dataframe).to_numpy() == expected).all()
+
+
+def test_pickle_linear_model(population_dataframe):
+    """Check a linear model gives the same output after pickling and unpickling"""
+    lm = LinearModel(
+        LinearModelType.LOGISTIC,
+        0.5,
+        Predictor('age_years').when('< 5', 2.).when('.between(5, 14)', 3.).otherwise(4.),
+        Predictor('sex').when('M', 1.5),
+        Predictor().when('li_urban & (region_of_residence == "Northern")', 0.5),
+    )
+    unpickled_lm = pickle.loads(pickle.dumps(lm))
+    pd.testing.assert_series_equal(
+        lm.predict(population_dataframe), unpickled_lm.predict(population_dataframe)
+    )
+
+
+def test_interval_conditions_on_integer_and_float_columns(population_dataframe):
+    """Check interval conditions give same output for integer and float columns"""
+    population_dataframe['age_years_float'] = population_dataframe.age_years.astype(float)
+
+    def make_model(property_name, **kwargs):
+        return LinearModel(
+            LinearModelType.MULTIPLICATIVE,
+            1.0,
+            Predictor(property_name, **kwargs)
+            .when('< 5', 1.)
+            .when('.between(5, 14)', 2.)
+            .when(15, 3.)
+            .when('<= 49', 4.)
+            .when('> 90', 5.),
+        )
+
+    for kwargs in ({}, {'conditions_are_mutually_exclusive': True}):
+        assert (
+            make_model('age_years', **kwargs).predict(population_dataframe)
+            == make_model('age_years_float', **kwargs).predict(population_dataframe)
+        ).all()
+
+
+@pytest.mark.parametrize(
+    'condition',
+    ['== "b"', '!= "b"', '== "z"', '!= "z"', '< "c"', '>= "b"']
+)
+def test_comparison_conditions_on_categorical_columns(condition):
+    """Check comparisons on (ordered and unordered) categorical columns match pandas"""
+    values = ['a', 'b', None, 'c', 'b', 'd', None, 'a']
+    df = pd.DataFrame({
+        'unordered': pd.Categorical(values, categories=['a', 'b', 'c', 'd']),
+        'ordered': pd.Categorical(values, categories=['d', 'c', 'b', 'a'], ordered=True),
+    })
+    for column in df.columns:
+        if condition[0] in '<>' and column == 'unordered':
+            # ordering comparisons only defined for ordered categoricals
+            continue
+        lm = LinearModel(LinearModelType.ADDITIVE, 0.0, Predictor(column).when(condition, 1.))
+        expected = df.eval(f'{column} {condition}', engine='python').astype(float)
+        assert lm.predict(df).tolist() == expected.tolist()
+
+
+def test_constant_predictors(population_dataframe):
+    """Check predictors with the same output for all rows are applied correctly"""
+    for lm_type, intercept in (
+        (LinearModelType.ADDITIVE, 0.5),
+        (LinearModelType.MULTIPLICATIVE, 2.0),
+        (LinearModelType.LOGISTIC, 2.0),
+    ):
+        lm = LinearModel(
+            lm_type,
+            intercept,
+            Predictor('age_years').otherwise(3.),
+            Predictor('sex').when('M', 5.),
+            Predictor('li_urban', conditions_are_exhaustive=True).when(True, 7.),
+            Predictor().when('False', 11.).when('True', 13.).when('age_years > 5', 17.),
+        )
+        lm_equivalent = LinearModel(
+            lm_type,
+            intercept,
+            Predictor().when('age_years >= 0', 3.),
+            Predictor('sex').when('M', 5.),
+            Predictor().when('age_years >= 0', 7.),
+            Predictor().when('age_years >= 0', 13.),
+        )
+        assert np.allclose(
+            lm.predict(population_dataframe),
+            lm_equivalent.predict(population_dataframe)
+        )
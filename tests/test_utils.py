@@ -1,4 +1,5 @@
 """Unit tests for utility functions."""
+import json
 import os
 import pickle
 import shutil
@@ -232,6 +233,62 @@ def test_logs_parsing(tmpdir):
         assert os.path.getsize(path_to_tmpdir / f"{key}.pickle") != 0
 
 
+def test_logs_parsing_cache(tmpdir):
+    """Check that results of parsing an unchanged log file are reused from the cache and that changing the log file
+    invalidates the cache."""
+
+    def write_log(path, values):
+        header = {
+            "uuid": "a1", "type": "header", "module": "tlo.methods.dummy", "key": "counts", "level": "INFO",
+            "columns": {"count": "int"}, "description": None,
+        }
+        with open(path, "w") as f:
+            f.write(json.dumps(header) + "\n")
+            for i, value in enumerate(values):
+                f.write(json.dumps({"uuid": "a1", "date": f"201{i}-01-01T00:00:00", "values": [value]}) + "\n")
+
+    log_path = Path(tmpdir) / "dummy.log"
+    write_log(log_path, [1, 2, 3])
+    first = parse_log_file(log_path, cache=True)["tlo.methods.dummy"]["counts"]
+    assert (Path(tmpdir) / ".cache").is_dir()
+    n_cache_files = len(list((Path(tmpdir) / ".cache").iterdir()))
+
+    # parsing the unchanged log file again should not rewrite the module-specific log file
+    split_log_state = os.stat(Path(tmpdir) / "tlo.methods.dummy.log").st_mtime_ns
+    second = parse_log_file(log_path, cache=True)["tlo.methods.dummy"]["counts"]
+    assert os.stat(Path(tmpdir) / "tlo.methods.dummy.log").st_mtime_ns == split_log_state
+    pd.testing.assert_frame_equal(first, second)
+    assert first["count"].tolist() == [1, 2, 3]
+
+    # changing the log file should give the updated results, replacing rather than adding to the cached results
+    for values in ([4, 5], [6], [7, 8, 9, 10]):
+        write_log(log_path, values)
+        assert parse_log_file(log_path, cache=True)["tlo.methods.dummy"]["counts"]["count"].tolist() == values
+    assert len(list((Path(tmpdir) / ".cache").iterdir())) == n_cache_files
+    write_log(log_path, [4, 5])
+    assert parse_log_file(log_path, cache=False)["tlo.methods.dummy"]["counts"]["count"].tolist() == [4, 5]
+
+
+def test_logs_parsing_cache_unloadable(tmpdir):
+    """Check that cache files which cannot be unpickled are treated as absent rather than raising an error."""
+    log_path = Path(tmpdir) / "dummy.log"
+    with open(log_path, "w") as f:
+        f.write(json.dumps({
+            "uuid": "a1", "type": "header", "module": "tlo.methods.dummy", "key": "counts", "level": "INFO",
+            "columns": {"count": "int"}, "description": None,
+        }) + "\n")
+        f.write(json.dumps({"uuid": "a1", "date": "2010-01-01T00:00:00", "values": [1]}) + "\n")
+    parse_log_file(log_path, cache=True)["tlo.methods.dummy"]["counts"]
+
+    # overwrite cache files with pickles referencing a module which does not exist
+    cache_files = list((Path(tmpdir) / ".cache").iterdir())
+    assert len(cache_files) > 0
+    for cache_file in cache_files:
+        cache_file.write_bytes(pickle.dumps(Path).replace(b"pathlib", b"notalib"))
+
+    assert parse_log_file(log_path, cache=True)["tlo.methods.dummy"]["counts"]["count"].tolist() == [1]
+
+
 def test_get_person_id_to_inherit_from(rng: np.random.RandomState):
     population_size = 1000
     num_test = 5
@@ -289,6 +346,15 @@ def test_random_date_returns_date_nonsequential(rng):
             tlo.util.random_date(start_date, end_date, rng)
 
 
+def test_get_year(rng):
+    dates = pd.Series(
+        pd.to_datetime('1969-12-31') + pd.to_timedelta(rng.randint(0, 365 * 200, size=100), unit='D')
+    )
+    assert (tlo.util.get_year(dates) == dates.dt.year).all()
+    assert (tlo.util.get_year(pd.DatetimeIndex(dates)) == dates.dt.year).all()
+    assert tlo.util.get_year(dates.values).tolist() == dates.dt.year.tolist()
+
+
 def test_hash_dataframe(rng):
     """ Check that hash types:
                 - are generated,